@@ -24,13 +24,45 @@ Each finding is a dict:
 No remediation steps are included. The attorney adds those.
 """
 
+# Imported under private aliases: main.yml's modules: block star-imports
+# this module into the interview namespace, and docassemble pickles any
+# public global there that is not a function, module or class.
+from dataclasses import dataclass as _dataclass, field as _field
+from operator import attrgetter as _attrgetter
+from sys import intern as _intern
+from typing import Callable as _Callable, Optional as _Optional
+
+
+# -----------------------------------------------
+# Severity and jurisdiction constants
+# -----------------------------------------------
+# The space or slash in these labels keeps CPython from interning the
+# literals itself, so they are interned here; identifier-like labels
+# such as 'GDPR' are already interned at compile time.
+MUST_FIX = _intern('Must Fix')
+SHOULD_FIX = _intern('Should Fix')
+CONSIDER = _intern('Consider Fixing')
+
+_GDPR = 'GDPR'
+_CCPA_CPRA = _intern('CCPA/CPRA')
+_TDPSA = 'TDPSA'
+_VCDPA = 'VCDPA'
+
+
+# -----------------------------------------------
+# Lawful basis keys (matters[i].gdpr.lawful_bases checkbox labels)
+# -----------------------------------------------
+_LB_CONSENT = 'Consent (Article 6(1)(a))'
+
 
 # -----------------------------------------------
-# Severity constants
+# Authorities cited by more than one finding
 # -----------------------------------------------
-MUST_FIX = 'Must Fix'
-SHOULD_FIX = 'Should Fix'
-CONSIDER = 'Consider Fixing'
+# One object per citation, so findings that cite the same provision
+# share it rather than each carrying its own copy.
+_AUTH_CCPA_POLICY = 'Cal. Civ. Code §1798.130(a)(5)'
+_AUTH_GDPR_LEGIT_INTERESTS = 'Article 6(1)(f) GDPR'
+_AUTH_VCDPA_PROCESSORS = 'Va. Code Ann. §59.1-580'
 
 
 # -----------------------------------------------
@@ -55,18 +87,167 @@ def _no_gap():
     return None
 
 
+# -----------------------------------------------
+# Posture rule tables
+# -----------------------------------------------
+# A rule fires when its guard (if any) holds for the matter and its
+# posture flag is falsy. Every rule's finding text is constant, so the
+# finding dict is built once here at import and the same dict is handed
+# back on every call — treat findings as read-only. They stay plain dicts
+# (not MappingProxyType) because run_gap_analysis()'s result is stored on
+# matters[i] and docassemble pickles it with the session.
+#
+# Guards must be named module-level functions, not lambdas, for the same
+# pickling reason given at the top of document_types.py.
+@_dataclass(frozen=True, slots=True)
+class _Rule:
+    flag: str
+    guard: _Optional[_Callable]
+    finding: dict
+    get_flag: _Callable = _field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Built once per rule so the evaluator calls a C-level getter
+        # instead of getattr(posture, rule.flag) on every evaluation.
+        object.__setattr__(self, 'get_flag', _attrgetter(self.flag))
+
+
+def _rules(jurisdiction, *specs):
+    """
+    Builds a rule table from (flag, guard, requirement, authority,
+    current_state, gap, policy_section, why_it_matters, severity) specs.
+    """
+    return tuple(
+        _Rule(flag, guard, _gap(jurisdiction, *text))
+        for flag, guard, *text in specs
+    )
+
+
+def _iter_rules(matter, rules, posture):
+    """
+    Evaluates a rule table against one jurisdiction's posture object and
+    yields the gap finding for every rule that fires, in table order.
+    """
+    for rule in rules:
+        # Guard before flag, deliberately: a guarded flag is only asked
+        # when its guard holds (`show if` in the posture questions, or the
+        # matching `if` in main.yml's trigger block), so reading it first
+        # would send docassemble after an answer that was never collected.
+        if rule.guard is not None and not rule.guard(matter):
+            continue
+        if not rule.get_flag(posture):
+            yield rule.finding
+
+
 # -----------------------------------------------
 # GDPR Gap Analysis
 # -----------------------------------------------
+def _gdpr_relies_on_consent(matter):
+    return matter.gdpr.lawful_bases.get(_LB_CONSENT, False)
+
+
+def _gdpr_international_transfers(matter):
+    return matter.gdpr.international_transfers
+
+
+# Breach-readiness (escalation contact, counsel on retainer) is
+# evaluated once per matter in analyse_breach_readiness_gaps below,
+# not per jurisdiction — see that function's docstring.
+#
+# DPIA completion is mandatory in the interview flow wherever
+# activity.is_high_risk is True (see dpia_assessment.yml / main.yml's
+# required sequence), so "was a DPIA done at all" is never actually
+# false by the time gap analysis runs. The substantive check — did
+# the completed DPIA's risk register leave an unresolved high-risk
+# item — lives in analyse_dpia_lia_gaps below.
+#
+# Staff training is evaluated once per matter in
+# analyse_staff_training_gaps below, not per jurisdiction — GDPR
+# Article 39(1)(b) and CCPA §1798.135(a)(3) are the same underlying
+# obligation in different statutory language.
+_GDPR_RULES = _rules(
+    _GDPR,
+    # --- Notices and Consent ---
+    (
+        'privacy_notice_provided', None,
+        'Privacy Notice at Collection',
+        'Articles 13 and 14 GDPR',
+        'No privacy notice provided to data subjects at point of collection.',
+        'The client does not currently provide a compliant privacy notice '
+        'at or before the point of data collection as required by Articles 13/14.',
+        '2. Notices & Consent',
+        'Data subjects cannot exercise their rights or trust how their '
+        'data is used if they were never told what is collected or why.',
+        MUST_FIX
+    ),
+    (
+        'cookie_consent_compliant', None,
+        'Cookie Consent Mechanism',
+        'ePrivacy Directive; GDPR Article 6',
+        'Cookie consent mechanism absent or non-compliant.',
+        'The client does not have a compliant cookie consent mechanism. '
+        'Non-essential cookies require prior, freely given, specific, '
+        'informed, and unambiguous consent.',
+        '2. Notices & Consent',
+        'Non-essential cookies set without valid consent expose the '
+        'client to both regulator enforcement and ePrivacy-driven '
+        'complaints.',
+        SHOULD_FIX
+    ),
+    (
+        'consent_records_maintained', _gdpr_relies_on_consent,
+        'Consent Records',
+        'Article 7(1) GDPR',
+        'Consent relied upon but no mechanism to record or evidence consent.',
+        'Where consent is the lawful basis, the controller must be able to '
+        'demonstrate that the data subject has consented. No consent '
+        'recording mechanism is currently in place.',
+        '2. Notices & Consent',
+        'Without a record of consent, the client cannot prove compliance '
+        'if a data subject or regulator challenges the lawful basis '
+        'relied upon.',
+        MUST_FIX
+    ),
+
+    # --- Rights and Contracts ---
+    (
+        'rights_procedure_documented', None,
+        'Data Subject Rights Procedure',
+        'Articles 15–22 GDPR',
+        'No documented procedure for handling data subject rights requests.',
+        'The client has no documented procedure for receiving, verifying, '
+        'and responding to data subject rights requests within the one-month '
+        'statutory deadline.',
+        '3. Data Subject / Consumer Rights Procedures',
+        "GDPR gives data subjects a one-month response deadline; without "
+        "a documented intake and verification procedure, that deadline "
+        "is easy to miss.",
+        MUST_FIX
+    ),
+    (
+        'transfer_mechanism_in_place', _gdpr_international_transfers,
+        'International Transfer Mechanism',
+        'Articles 44–49 GDPR',
+        'Personal data transferred outside UK/EEA without an adequate transfer mechanism.',
+        'The client transfers personal data to third countries but does not '
+        'have an appropriate transfer mechanism (adequacy decision, SCCs, BCRs, '
+        'or IDTA) in place as required by Chapter V GDPR.',
+        '1. Lawful Basis & Documentation',
+        'Moving personal data outside the UK/EEA without an approved '
+        'transfer mechanism is an independent violation even where the '
+        'underlying processing itself is otherwise lawful.',
+        MUST_FIX
+    ),
+)
+
+
 def analyse_gdpr_gaps(matter):
     """
     Evaluates GDPR compliance posture and returns a list
     of gap finding dicts.
     """
     findings = []
-    p = matter.gdpr.posture
-    g = matter.gdpr
-    J = 'GDPR'
+    J = _GDPR
 
     # --- Documentation ---
 
@@ -127,491 +308,400 @@ def analyse_gdpr_gaps(matter):
     # substantive check — did the completed LIA conclude the basis
     # doesn't survive — lives in analyse_dpia_lia_gaps below.
 
-    # --- Notices and Consent ---
-
-    if not p.privacy_notice_provided:
-        findings.append(_gap(
-            J,
-            'Privacy Notice at Collection',
-            'Articles 13 and 14 GDPR',
-            'No privacy notice provided to data subjects at point of collection.',
-            'The client does not currently provide a compliant privacy notice '
-            'at or before the point of data collection as required by Articles 13/14.',
-            '2. Notices & Consent',
-            'Data subjects cannot exercise their rights or trust how their '
-            'data is used if they were never told what is collected or why.',
-            MUST_FIX
-        ))
-
-    if not p.cookie_consent_compliant:
-        findings.append(_gap(
-            J,
-            'Cookie Consent Mechanism',
-            'ePrivacy Directive; GDPR Article 6',
-            'Cookie consent mechanism absent or non-compliant.',
-            'The client does not have a compliant cookie consent mechanism. '
-            'Non-essential cookies require prior, freely given, specific, '
-            'informed, and unambiguous consent.',
-            '2. Notices & Consent',
-            'Non-essential cookies set without valid consent expose the '
-            'client to both regulator enforcement and ePrivacy-driven '
-            'complaints.',
-            SHOULD_FIX
-        ))
-
-    if (g.lawful_bases.get('Consent (Article 6(1)(a))', False)
-            and not p.consent_records_maintained):
-        findings.append(_gap(
-            J,
-            'Consent Records',
-            'Article 7(1) GDPR',
-            'Consent relied upon but no mechanism to record or evidence consent.',
-            'Where consent is the lawful basis, the controller must be able to '
-            'demonstrate that the data subject has consented. No consent '
-            'recording mechanism is currently in place.',
-            '2. Notices & Consent',
-            'Without a record of consent, the client cannot prove compliance '
-            'if a data subject or regulator challenges the lawful basis '
-            'relied upon.',
-            MUST_FIX
-        ))
-
-    # --- Rights and Contracts ---
-
-    if not p.rights_procedure_documented:
-        findings.append(_gap(
-            J,
-            'Data Subject Rights Procedure',
-            'Articles 15–22 GDPR',
-            'No documented procedure for handling data subject rights requests.',
-            'The client has no documented procedure for receiving, verifying, '
-            'and responding to data subject rights requests within the one-month '
-            'statutory deadline.',
-            '3. Data Subject / Consumer Rights Procedures',
-            "GDPR gives data subjects a one-month response deadline; without "
-            "a documented intake and verification procedure, that deadline "
-            "is easy to miss.",
-            MUST_FIX
-        ))
-
-    if g.international_transfers and not p.transfer_mechanism_in_place:
-        findings.append(_gap(
-            J,
-            'International Transfer Mechanism',
-            'Articles 44–49 GDPR',
-            'Personal data transferred outside UK/EEA without an adequate transfer mechanism.',
-            'The client transfers personal data to third countries but does not '
-            'have an appropriate transfer mechanism (adequacy decision, SCCs, BCRs, '
-            'or IDTA) in place as required by Chapter V GDPR.',
-            '1. Lawful Basis & Documentation',
-            'Moving personal data outside the UK/EEA without an approved '
-            'transfer mechanism is an independent violation even where the '
-            'underlying processing itself is otherwise lawful.',
-            MUST_FIX
-        ))
-
-    # --- Security and Breach ---
-    # Breach-readiness (escalation contact, counsel on retainer) is
-    # evaluated once per matter in analyse_breach_readiness_gaps below,
-    # not per jurisdiction — see that function's docstring.
-
-    # DPIA completion is mandatory in the interview flow wherever
-    # activity.is_high_risk is True (see dpia_assessment.yml / main.yml's
-    # required sequence), so "was a DPIA done at all" is never actually
-    # false by the time gap analysis runs. The substantive check — did
-    # the completed DPIA's risk register leave an unresolved high-risk
-    # item — lives in analyse_dpia_lia_gaps below.
-
-    # Staff training is evaluated once per matter in
-    # analyse_staff_training_gaps below, not per jurisdiction — GDPR
-    # Article 39(1)(b) and CCPA §1798.135(a)(3) are the same underlying
-    # obligation in different statutory language.
-
+    findings.extend(_iter_rules(matter, _GDPR_RULES, matter.gdpr.posture))
     return findings
 
 
 # -----------------------------------------------
 # CCPA/CPRA Gap Analysis
 # -----------------------------------------------
+def _ccpa_sells_pi(matter):
+    return matter.ccpa.sells_pi
+
+
+def _ccpa_uses_spi_beyond_primary(matter):
+    return matter.ccpa.uses_spi_beyond_primary
+
+
+_CCPA_RULES = _rules(
+    _CCPA_CPRA,
+    (
+        'notice_at_collection', None,
+        'Notice at Collection',
+        'Cal. Civ. Code §1798.100(a)',
+        'No privacy notice at collection provided to California consumers.',
+        'The client does not provide a notice at or before the point of '
+        'collecting personal information disclosing the categories of PI '
+        'collected and the purposes for which it is used.',
+        '2. Notices & Consent',
+        'California consumers must be told what is collected and why '
+        'before or at the point of collection — this is the CCPA analog '
+        "to GDPR's Article 13/14 notice.",
+        MUST_FIX
+    ),
+    (
+        'policy_updated_12mo', None,
+        'Privacy Policy Currency',
+        _AUTH_CCPA_POLICY,
+        'Published privacy policy not updated within the last 12 months.',
+        'Businesses subject to CCPA must update their privacy policy at '
+        'least once every 12 months.',
+        '2. Notices & Consent',
+        'A stale privacy policy misrepresents current practices and is '
+        'itself a CCPA violation regardless of whether the underlying '
+        'practices are compliant.',
+        MUST_FIX
+    ),
+    (
+        'policy_disclosures_complete', None,
+        'Required Privacy Policy Disclosures',
+        _AUTH_CCPA_POLICY,
+        'Privacy policy does not include all required CCPA/CPRA disclosures.',
+        'The client\'s current privacy policy is missing one or more of the '
+        'disclosures required by CCPA/CPRA, including categories of PI '
+        'collected, sources, purposes, third-party disclosures, and '
+        'consumer rights.',
+        '2. Notices & Consent',
+        'Missing required disclosures (categories, sources, purposes, '
+        'third-party sharing, rights) leaves consumers unable to '
+        'understand or exercise their CCPA rights.',
+        MUST_FIX
+    ),
+    (
+        'opt_out_mechanism_in_place', _ccpa_sells_pi,
+        '"Do Not Sell or Share" Opt-Out Mechanism',
+        'Cal. Civ. Code §1798.120',
+        'Client sells/shares PI but no opt-out mechanism is in place.',
+        'The client sells or shares personal information but has not '
+        'implemented a "Do Not Sell or Share My Personal Information" '
+        'link or equivalent mechanism as required.',
+        '2. Notices & Consent',
+        'Selling or sharing personal information without a working '
+        'opt-out mechanism is a direct CCPA violation, not a '
+        'best-practice gap.',
+        MUST_FIX
+    ),
+    (
+        'gpc_honoured', None,
+        'Global Privacy Control (GPC) Signal',
+        'CPPA Regulations §999.315(d)',
+        'Global Privacy Control signal not honoured.',
+        'The client does not automatically honour the Global Privacy Control '
+        'opt-out signal. This is required under CPPA regulations for businesses '
+        'subject to CCPA/CPRA.',
+        '2. Notices & Consent',
+        'The Global Privacy Control signal is a legally recognized '
+        "opt-out under CPPA regulations — ignoring it is the same as "
+        "ignoring a consumer's explicit opt-out request.",
+        MUST_FIX
+    ),
+    (
+        'spi_limit_mechanism_in_place', _ccpa_uses_spi_beyond_primary,
+        '"Limit Use of Sensitive Personal Information" Mechanism',
+        'Cal. Civ. Code §1798.121',
+        'SPI used beyond primary purpose but no limit mechanism in place.',
+        'The client uses sensitive personal information beyond what is '
+        'necessary for the primary purpose but has not provided a mechanism '
+        'for consumers to limit such use as required by §1798.121.',
+        '2. Notices & Consent',
+        'Consumers have an affirmative right to limit use of sensitive '
+        'personal information beyond the primary purpose; without a '
+        'mechanism to exercise it, that right is theoretical.',
+        MUST_FIX
+    ),
+    (
+        'rights_procedure_45_days', None,
+        'Consumer Rights Request Procedure (45-day)',
+        'Cal. Civ. Code §1798.105, §1798.106',
+        'No documented procedure to respond to consumer rights requests within 45 days.',
+        'The client has no documented procedure for receiving and responding '
+        'to consumer rights requests within the 45-day statutory deadline '
+        '(extendable by an additional 45 days with notice).',
+        '3. Data Subject / Consumer Rights Procedures',
+        'CCPA imposes a 45-day statutory deadline (extendable once) to '
+        'respond to consumer rights requests — missing it is a '
+        'compliance failure regardless of the eventual substantive '
+        'response.',
+        MUST_FIX
+    ),
+    (
+        'deletion_verification_in_place', None,
+        'Two-Step Verification for Deletion Requests',
+        'CPPA Regulations §999.323',
+        'No two-step verification process for deletion requests implemented.',
+        'A two-step verification process for online deletion requests is '
+        'recommended under CPPA regulations to reduce fraudulent requests.',
+        '3. Data Subject / Consumer Rights Procedures',
+        'Deleting data for the wrong person, or refusing a legitimate '
+        'deletion request for lack of verification, are both real risks '
+        'without a two-step verification process.',
+        SHOULD_FIX
+    ),
+)
+
+
+def _iter_ccpa_gaps(matter):
+    return _iter_rules(matter, _CCPA_RULES, matter.ccpa.posture)
+
+
 def analyse_ccpa_gaps(matter):
     """
     Evaluates CCPA/CPRA compliance posture and returns gap findings.
     """
-    findings = []
-    p = matter.ccpa.posture
-    c = matter.ccpa
-    J = 'CCPA/CPRA'
+    return list(_iter_ccpa_gaps(matter))
 
-    if not p.notice_at_collection:
-        findings.append(_gap(
-            J,
-            'Notice at Collection',
-            'Cal. Civ. Code §1798.100(a)',
-            'No privacy notice at collection provided to California consumers.',
-            'The client does not provide a notice at or before the point of '
-            'collecting personal information disclosing the categories of PI '
-            'collected and the purposes for which it is used.',
-            '2. Notices & Consent',
-            'California consumers must be told what is collected and why '
-            'before or at the point of collection — this is the CCPA analog '
-            "to GDPR's Article 13/14 notice.",
-            MUST_FIX
-        ))
 
-    if not p.policy_updated_12mo:
-        findings.append(_gap(
-            J,
-            'Privacy Policy Currency',
-            'Cal. Civ. Code §1798.130(a)(5)',
-            'Published privacy policy not updated within the last 12 months.',
-            'Businesses subject to CCPA must update their privacy policy at '
-            'least once every 12 months.',
-            '2. Notices & Consent',
-            'A stale privacy policy misrepresents current practices and is '
-            'itself a CCPA violation regardless of whether the underlying '
-            'practices are compliant.',
-            MUST_FIX
-        ))
-
-    if not p.policy_disclosures_complete:
-        findings.append(_gap(
-            J,
-            'Required Privacy Policy Disclosures',
-            'Cal. Civ. Code §1798.130(a)(5)',
-            'Privacy policy does not include all required CCPA/CPRA disclosures.',
-            'The client\'s current privacy policy is missing one or more of the '
-            'disclosures required by CCPA/CPRA, including categories of PI '
-            'collected, sources, purposes, third-party disclosures, and '
-            'consumer rights.',
-            '2. Notices & Consent',
-            'Missing required disclosures (categories, sources, purposes, '
-            'third-party sharing, rights) leaves consumers unable to '
-            'understand or exercise their CCPA rights.',
-            MUST_FIX
-        ))
-
-    if c.sells_pi and not p.opt_out_mechanism_in_place:
-        findings.append(_gap(
-            J,
-            '"Do Not Sell or Share" Opt-Out Mechanism',
-            'Cal. Civ. Code §1798.120',
-            'Client sells/shares PI but no opt-out mechanism is in place.',
-            'The client sells or shares personal information but has not '
-            'implemented a "Do Not Sell or Share My Personal Information" '
-            'link or equivalent mechanism as required.',
-            '2. Notices & Consent',
-            'Selling or sharing personal information without a working '
-            'opt-out mechanism is a direct CCPA violation, not a '
-            'best-practice gap.',
-            MUST_FIX
-        ))
-
-    if not p.gpc_honoured:
-        findings.append(_gap(
-            J,
-            'Global Privacy Control (GPC) Signal',
-            'CPPA Regulations §999.315(d)',
-            'Global Privacy Control signal not honoured.',
-            'The client does not automatically honour the Global Privacy Control '
-            'opt-out signal. This is required under CPPA regulations for businesses '
-            'subject to CCPA/CPRA.',
-            '2. Notices & Consent',
-            'The Global Privacy Control signal is a legally recognized '
-            "opt-out under CPPA regulations — ignoring it is the same as "
-            "ignoring a consumer's explicit opt-out request.",
-            MUST_FIX
-        ))
-
-    if c.uses_spi_beyond_primary and not p.spi_limit_mechanism_in_place:
-        findings.append(_gap(
-            J,
-            '"Limit Use of Sensitive Personal Information" Mechanism',
-            'Cal. Civ. Code §1798.121',
-            'SPI used beyond primary purpose but no limit mechanism in place.',
-            'The client uses sensitive personal information beyond what is '
-            'necessary for the primary purpose but has not provided a mechanism '
-            'for consumers to limit such use as required by §1798.121.',
-            '2. Notices & Consent',
-            'Consumers have an affirmative right to limit use of sensitive '
-            'personal information beyond the primary purpose; without a '
-            'mechanism to exercise it, that right is theoretical.',
-            MUST_FIX
-        ))
-
-    if not p.rights_procedure_45_days:
-        findings.append(_gap(
-            J,
-            'Consumer Rights Request Procedure (45-day)',
-            'Cal. Civ. Code §1798.105, §1798.106',
-            'No documented procedure to respond to consumer rights requests within 45 days.',
-            'The client has no documented procedure for receiving and responding '
-            'to consumer rights requests within the 45-day statutory deadline '
-            '(extendable by an additional 45 days with notice).',
-            '3. Data Subject / Consumer Rights Procedures',
-            'CCPA imposes a 45-day statutory deadline (extendable once) to '
-            'respond to consumer rights requests — missing it is a '
-            'compliance failure regardless of the eventual substantive '
-            'response.',
-            MUST_FIX
-        ))
-
-    if not p.deletion_verification_in_place:
-        findings.append(_gap(
-            J,
-            'Two-Step Verification for Deletion Requests',
-            'CPPA Regulations §999.323',
-            'No two-step verification process for deletion requests implemented.',
-            'A two-step verification process for online deletion requests is '
-            'recommended under CPPA regulations to reduce fraudulent requests.',
-            '3. Data Subject / Consumer Rights Procedures',
-            'Deleting data for the wrong person, or refusing a legitimate '
-            'deletion request for lack of verification, are both real risks '
-            'without a two-step verification process.',
-            SHOULD_FIX
-        ))
-
-    return findings
+# -----------------------------------------------
+# Shared state-act rule skeletons
+# -----------------------------------------------
+# Requirement, current state, policy section and severity that TDPSA and
+# VCDPA word identically for the same posture flag. Each act still
+# supplies its own authority, gap and why-it-matters text, since those
+# cite and paraphrase its own statute.
+_STATE_ACT_SKELETONS = {
+    'rights_procedure_45_days': (
+        'Consumer Rights Response Procedure (45-day)',
+        'No documented procedure to respond to consumer requests within 45 days.',
+        '3. Data Subject / Consumer Rights Procedures',
+        MUST_FIX,
+    ),
+    'appeals_procedure': (
+        'Consumer Appeals Procedure',
+        'No appeals procedure in place for denied consumer requests.',
+        '3. Data Subject / Consumer Rights Procedures',
+        MUST_FIX,
+    ),
+    'opt_out_mechanism_in_place': (
+        'Opt-Out Mechanism for Targeted Advertising / Sale / Profiling',
+        'No opt-out mechanism in place for applicable processing activities.',
+        '2. Notices & Consent',
+        MUST_FIX,
+    ),
+}
+
+
+def _state_act_rule(flag, guard, authority, gap, why_it_matters):
+    """
+    Expands a shared skeleton into a full _rules() spec for one act.
+    """
+    requirement, current_state, policy_section, severity = (
+        _STATE_ACT_SKELETONS[flag]
+    )
+    return (flag, guard, requirement, authority, current_state, gap,
+            policy_section, why_it_matters, severity)
 
 
 # -----------------------------------------------
 # TDPSA Gap Analysis
 # -----------------------------------------------
+def _tdpsa_include_opt_out_section(matter):
+    return matter.tdpsa.include_opt_out_section
+
+
+def _footprint_processes_sensitive_data(matter):
+    return matter.footprint.processes_sensitive_data
+
+
+_TDPSA_RULES = _rules(
+    _TDPSA,
+    (
+        'privacy_notice_provided', None,
+        'Privacy Notice',
+        'Tex. Bus. & Com. Code §541.101',
+        'No TDPSA-compliant privacy notice provided to Texas consumers.',
+        'Controllers must provide consumers with a reasonably accessible, '
+        'clear, and meaningful privacy notice covering required disclosures.',
+        '2. Notices & Consent',
+        'Texas consumers are entitled to the same baseline notice '
+        'protections as California and Virginia consumers under TDPSA.',
+        MUST_FIX
+    ),
+    _state_act_rule(
+        'rights_procedure_45_days', None,
+        'Tex. Bus. & Com. Code §541.052',
+        'Controllers must respond to authenticated consumer rights requests '
+        'within 45 days, with a possible 45-day extension on notice.',
+        'TDPSA imposes the same 45-day response structure as CCPA and '
+        'VCDPA — a documented procedure is what keeps that deadline from '
+        'being missed.',
+    ),
+    _state_act_rule(
+        'appeals_procedure', None,
+        'Tex. Bus. & Com. Code §541.053',
+        'Controllers must establish an internal appeals process for '
+        'consumers to appeal the denial of a rights request.',
+        'Consumers have a statutory right to appeal a denied request; '
+        'without an internal appeals process, that right cannot '
+        'actually be exercised.',
+    ),
+    _state_act_rule(
+        'opt_out_mechanism_in_place', _tdpsa_include_opt_out_section,
+        'Tex. Bus. & Com. Code §541.051',
+        'The client engages in targeted advertising, sale of personal data, '
+        'or profiling with significant effects but has not provided a clear '
+        'mechanism for consumers to opt out.',
+        'Targeted advertising, sale, and significant-effect profiling '
+        'all trigger a consumer opt-out right under TDPSA that requires '
+        'an actual working mechanism.',
+    ),
+    (
+        'uoom_supported', None,
+        'Universal Opt-Out Mechanism (UOOM)',
+        'Tex. Bus. & Com. Code §541.056',
+        'Universal Opt-Out Mechanism not supported.',
+        'Controllers must honour a universal opt-out mechanism recognised '
+        'by the Texas Attorney General. The client does not currently '
+        'support any such mechanism.',
+        '2. Notices & Consent',
+        'Texas requires honoring recognized universal opt-out signals — '
+        'without support, individually-set opt-outs can be silently '
+        'ignored at scale.',
+        MUST_FIX
+    ),
+    (
+        'sensitive_data_consent_obtained', _footprint_processes_sensitive_data,
+        'Sensitive Data Opt-In Consent',
+        'Tex. Bus. & Com. Code §541.101(b)',
+        'Sensitive data processed without opt-in consent mechanism.',
+        'Processing of sensitive personal data requires the consumer\'s '
+        'prior opt-in consent. No consent mechanism is currently in place.',
+        '2. Notices & Consent',
+        'Processing sensitive personal data without prior opt-in '
+        'consent is a standalone TDPSA violation, independent of any '
+        'other lawful basis analysis.',
+        MUST_FIX
+    ),
+    (
+        'dpa_assessments_completed', _tdpsa_include_opt_out_section,
+        'Data Protection Assessments',
+        'Tex. Bus. & Com. Code §541.105',
+        'Data Protection Assessments not completed for high-risk processing.',
+        'Controllers must conduct and document Data Protection Assessments '
+        'before engaging in processing that presents a heightened risk of harm.',
+        '9. Assessments (DPIA/LIA)',
+        'Texas requires a documented risk assessment before engaging in '
+        "higher-risk processing — the same underlying discipline as "
+        "GDPR's DPIA, just under a different statute.",
+        MUST_FIX
+    ),
+)
+
+
+def _iter_tdpsa_gaps(matter):
+    return _iter_rules(matter, _TDPSA_RULES, matter.tdpsa.posture)
+
+
 def analyse_tdpsa_gaps(matter):
     """
     Evaluates TDPSA compliance posture and returns gap findings.
     """
-    findings = []
-    p = matter.tdpsa.posture
-    t = matter.tdpsa
-    J = 'TDPSA'
-
-    if not p.privacy_notice_provided:
-        findings.append(_gap(
-            J,
-            'Privacy Notice',
-            'Tex. Bus. & Com. Code §541.101',
-            'No TDPSA-compliant privacy notice provided to Texas consumers.',
-            'Controllers must provide consumers with a reasonably accessible, '
-            'clear, and meaningful privacy notice covering required disclosures.',
-            '2. Notices & Consent',
-            'Texas consumers are entitled to the same baseline notice '
-            'protections as California and Virginia consumers under TDPSA.',
-            MUST_FIX
-        ))
-
-    if not p.rights_procedure_45_days:
-        findings.append(_gap(
-            J,
-            'Consumer Rights Response Procedure (45-day)',
-            'Tex. Bus. & Com. Code §541.052',
-            'No documented procedure to respond to consumer requests within 45 days.',
-            'Controllers must respond to authenticated consumer rights requests '
-            'within 45 days, with a possible 45-day extension on notice.',
-            '3. Data Subject / Consumer Rights Procedures',
-            'TDPSA imposes the same 45-day response structure as CCPA and '
-            'VCDPA — a documented procedure is what keeps that deadline from '
-            'being missed.',
-            MUST_FIX
-        ))
-
-    if not p.appeals_procedure:
-        findings.append(_gap(
-            J,
-            'Consumer Appeals Procedure',
-            'Tex. Bus. & Com. Code §541.053',
-            'No appeals procedure in place for denied consumer requests.',
-            'Controllers must establish an internal appeals process for '
-            'consumers to appeal the denial of a rights request.',
-            '3. Data Subject / Consumer Rights Procedures',
-            'Consumers have a statutory right to appeal a denied request; '
-            'without an internal appeals process, that right cannot '
-            'actually be exercised.',
-            MUST_FIX
-        ))
-
-    if t.include_opt_out_section and not p.opt_out_mechanism_in_place:
-        findings.append(_gap(
-            J,
-            'Opt-Out Mechanism for Targeted Advertising / Sale / Profiling',
-            'Tex. Bus. & Com. Code §541.051',
-            'No opt-out mechanism in place for applicable processing activities.',
-            'The client engages in targeted advertising, sale of personal data, '
-            'or profiling with significant effects but has not provided a clear '
-            'mechanism for consumers to opt out.',
-            '2. Notices & Consent',
-            'Targeted advertising, sale, and significant-effect profiling '
-            'all trigger a consumer opt-out right under TDPSA that requires '
-            'an actual working mechanism.',
-            MUST_FIX
-        ))
-
-    if not p.uoom_supported:
-        findings.append(_gap(
-            J,
-            'Universal Opt-Out Mechanism (UOOM)',
-            'Tex. Bus. & Com. Code §541.056',
-            'Universal Opt-Out Mechanism not supported.',
-            'Controllers must honour a universal opt-out mechanism recognised '
-            'by the Texas Attorney General. The client does not currently '
-            'support any such mechanism.',
-            '2. Notices & Consent',
-            'Texas requires honoring recognized universal opt-out signals — '
-            'without support, individually-set opt-outs can be silently '
-            'ignored at scale.',
-            MUST_FIX
-        ))
-
-    if matter.footprint.processes_sensitive_data and not p.sensitive_data_consent_obtained:
-        findings.append(_gap(
-            J,
-            'Sensitive Data Opt-In Consent',
-            'Tex. Bus. & Com. Code §541.101(b)',
-            'Sensitive data processed without opt-in consent mechanism.',
-            'Processing of sensitive personal data requires the consumer\'s '
-            'prior opt-in consent. No consent mechanism is currently in place.',
-            '2. Notices & Consent',
-            'Processing sensitive personal data without prior opt-in '
-            'consent is a standalone TDPSA violation, independent of any '
-            'other lawful basis analysis.',
-            MUST_FIX
-        ))
-
-    if t.include_opt_out_section and not p.dpa_assessments_completed:
-        findings.append(_gap(
-            J,
-            'Data Protection Assessments',
-            'Tex. Bus. & Com. Code §541.105',
-            'Data Protection Assessments not completed for high-risk processing.',
-            'Controllers must conduct and document Data Protection Assessments '
-            'before engaging in processing that presents a heightened risk of harm.',
-            '9. Assessments (DPIA/LIA)',
-            'Texas requires a documented risk assessment before engaging in '
-            "higher-risk processing — the same underlying discipline as "
-            "GDPR's DPIA, just under a different statute.",
-            MUST_FIX
-        ))
-
-    return findings
+    return list(_iter_tdpsa_gaps(matter))
 
 
 # -----------------------------------------------
 # VCDPA Gap Analysis
 # -----------------------------------------------
+def _vcdpa_include_opt_out_section(matter):
+    return matter.vcdpa.include_opt_out_section
+
+
+def _vcdpa_processes_sensitive_data(matter):
+    return matter.vcdpa.processes_sensitive_data
+
+
+_VCDPA_RULES = _rules(
+    _VCDPA,
+    (
+        'privacy_notice_provided', None,
+        'Privacy Notice',
+        'Va. Code Ann. §59.1-578(A)',
+        'No VCDPA-compliant privacy notice provided to Virginia consumers.',
+        'Controllers must provide consumers with a reasonably accessible '
+        'privacy notice that includes all disclosures required by §59.1-578.',
+        '2. Notices & Consent',
+        'Virginia consumers are entitled to the same baseline notice '
+        'protections required across every comprehensive state privacy '
+        'law this tool tracks.',
+        MUST_FIX
+    ),
+    _state_act_rule(
+        'rights_procedure_45_days', None,
+        'Va. Code Ann. §59.1-581(A)',
+        'Controllers must respond to authenticated consumer rights requests '
+        'within 45 days. An additional 45-day extension is permitted with notice.',
+        "VCDPA's 45-day response deadline mirrors CCPA/TDPSA — a "
+        'documented procedure is what keeps it from being missed.',
+    ),
+    _state_act_rule(
+        'appeals_procedure', None,
+        'Va. Code Ann. §59.1-581(C)',
+        'Controllers must establish and make available an internal process '
+        'for consumers to appeal the denial of any rights request.',
+        'Virginia consumers have the same statutory appeal right as '
+        'Texas consumers; without a process to handle it, the right is '
+        'theoretical.',
+    ),
+    _state_act_rule(
+        'opt_out_mechanism_in_place', _vcdpa_include_opt_out_section,
+        'Va. Code Ann. §59.1-578(A)(5)',
+        'The client engages in targeted advertising, sale of personal data, '
+        'or profiling with significant effects but has not provided a '
+        'mechanism for consumers to opt out.',
+        'Targeted advertising, sale, and significant-effect profiling '
+        'trigger a consumer opt-out right under VCDPA that requires an '
+        'actual working mechanism.',
+    ),
+    (
+        'sensitive_data_consent_obtained', _vcdpa_processes_sensitive_data,
+        'Sensitive Data Opt-In Consent',
+        'Va. Code Ann. §59.1-578(B)',
+        'Sensitive data processed without opt-in consent.',
+        'Processing of sensitive data requires the consumer\'s prior, '
+        'freely given, specific, and unambiguous opt-in consent. '
+        'No such mechanism is currently in place.',
+        '2. Notices & Consent',
+        'Processing sensitive data without prior opt-in consent is a '
+        'standalone VCDPA violation.',
+        MUST_FIX
+    ),
+    (
+        'pia_assessments_completed', _vcdpa_include_opt_out_section,
+        'Data Protection Impact Assessments (PIAs)',
+        'Va. Code Ann. §59.1-582',
+        'Data Protection Impact Assessments not completed for high-risk processing.',
+        'Controllers must conduct and document Data Protection Impact '
+        'Assessments for processing activities that present a heightened '
+        'risk of harm to consumers.',
+        '9. Assessments (DPIA/LIA)',
+        'Virginia requires a documented risk assessment before '
+        "higher-risk processing — the same discipline as GDPR's DPIA "
+        "and TDPSA's Data Protection Assessment.",
+        MUST_FIX
+    ),
+    (
+        'third_party_contracts_updated', None,
+        'Third-Party Contracts Updated for VCDPA',
+        _AUTH_VCDPA_PROCESSORS,
+        'Contracts with third parties not reviewed or updated for VCDPA compliance.',
+        'Existing contracts with third parties who receive personal data '
+        'should be reviewed and updated to include VCDPA-required provisions.',
+        '5. Vendor & DPA Management',
+        'Older vendor contracts predating VCDPA are unlikely to include '
+        'the processor obligations the statute now requires.',
+        SHOULD_FIX
+    ),
+)
+
+
+def _iter_vcdpa_gaps(matter):
+    return _iter_rules(matter, _VCDPA_RULES, matter.vcdpa.posture)
+
+
 def analyse_vcdpa_gaps(matter):
     """
     Evaluates VCDPA compliance posture and returns gap findings.
     """
-    findings = []
-    p = matter.vcdpa.posture
-    v = matter.vcdpa
-    J = 'VCDPA'
-
-    if not p.privacy_notice_provided:
-        findings.append(_gap(
-            J,
-            'Privacy Notice',
-            'Va. Code Ann. §59.1-578(A)',
-            'No VCDPA-compliant privacy notice provided to Virginia consumers.',
-            'Controllers must provide consumers with a reasonably accessible '
-            'privacy notice that includes all disclosures required by §59.1-578.',
-            '2. Notices & Consent',
-            'Virginia consumers are entitled to the same baseline notice '
-            'protections required across every comprehensive state privacy '
-            'law this tool tracks.',
-            MUST_FIX
-        ))
-
-    if not p.rights_procedure_45_days:
-        findings.append(_gap(
-            J,
-            'Consumer Rights Response Procedure (45-day)',
-            'Va. Code Ann. §59.1-581(A)',
-            'No documented procedure to respond to consumer requests within 45 days.',
-            'Controllers must respond to authenticated consumer rights requests '
-            'within 45 days. An additional 45-day extension is permitted with notice.',
-            '3. Data Subject / Consumer Rights Procedures',
-            "VCDPA's 45-day response deadline mirrors CCPA/TDPSA — a "
-            'documented procedure is what keeps it from being missed.',
-            MUST_FIX
-        ))
-
-    if not p.appeals_procedure:
-        findings.append(_gap(
-            J,
-            'Consumer Appeals Procedure',
-            'Va. Code Ann. §59.1-581(C)',
-            'No appeals procedure in place for denied consumer requests.',
-            'Controllers must establish and make available an internal process '
-            'for consumers to appeal the denial of any rights request.',
-            '3. Data Subject / Consumer Rights Procedures',
-            'Virginia consumers have the same statutory appeal right as '
-            'Texas consumers; without a process to handle it, the right is '
-            'theoretical.',
-            MUST_FIX
-        ))
-
-    if v.include_opt_out_section and not p.opt_out_mechanism_in_place:
-        findings.append(_gap(
-            J,
-            'Opt-Out Mechanism for Targeted Advertising / Sale / Profiling',
-            'Va. Code Ann. §59.1-578(A)(5)',
-            'No opt-out mechanism in place for applicable processing activities.',
-            'The client engages in targeted advertising, sale of personal data, '
-            'or profiling with significant effects but has not provided a '
-            'mechanism for consumers to opt out.',
-            '2. Notices & Consent',
-            'Targeted advertising, sale, and significant-effect profiling '
-            'trigger a consumer opt-out right under VCDPA that requires an '
-            'actual working mechanism.',
-            MUST_FIX
-        ))
-
-    if v.processes_sensitive_data and not p.sensitive_data_consent_obtained:
-        findings.append(_gap(
-            J,
-            'Sensitive Data Opt-In Consent',
-            'Va. Code Ann. §59.1-578(B)',
-            'Sensitive data processed without opt-in consent.',
-            'Processing of sensitive data requires the consumer\'s prior, '
-            'freely given, specific, and unambiguous opt-in consent. '
-            'No such mechanism is currently in place.',
-            '2. Notices & Consent',
-            'Processing sensitive data without prior opt-in consent is a '
-            'standalone VCDPA violation.',
-            MUST_FIX
-        ))
-
-    if v.include_opt_out_section and not p.pia_assessments_completed:
-        findings.append(_gap(
-            J,
-            'Data Protection Impact Assessments (PIAs)',
-            'Va. Code Ann. §59.1-582',
-            'Data Protection Impact Assessments not completed for high-risk processing.',
-            'Controllers must conduct and document Data Protection Impact '
-            'Assessments for processing activities that present a heightened '
-            'risk of harm to consumers.',
-            '9. Assessments (DPIA/LIA)',
-            'Virginia requires a documented risk assessment before '
-            "higher-risk processing — the same discipline as GDPR's DPIA "
-            "and TDPSA's Data Protection Assessment.",
-            MUST_FIX
-        ))
-
-    if not p.third_party_contracts_updated:
-        findings.append(_gap(
-            J,
-            'Third-Party Contracts Updated for VCDPA',
-            'Va. Code Ann. §59.1-580',
-            'Contracts with third parties not reviewed or updated for VCDPA compliance.',
-            'Existing contracts with third parties who receive personal data '
-            'should be reviewed and updated to include VCDPA-required provisions.',
-            '5. Vendor & DPA Management',
-            'Older vendor contracts predating VCDPA are unlikely to include '
-            'the processor obligations the statute now requires.',
-            SHOULD_FIX
-        ))
-
-    return findings
+    return list(_iter_vcdpa_gaps(matter))
 
 
 # -----------------------------------------------
@@ -1518,20 +1608,20 @@ def analyse_vendor_dpa_gaps(matter):
     confirmed = matter.confirmed_jurisdictions.true_values()
 
     authorities = []
-    if 'GDPR' in confirmed:
+    if _GDPR in confirmed:
         authorities.append('Article 28 GDPR')
-    if 'CCPA/CPRA' in confirmed:
+    if _CCPA_CPRA in confirmed:
         authorities.append('Cal. Civ. Code §1798.140(ag)')
-    if 'TDPSA' in confirmed:
+    if _TDPSA in confirmed:
         authorities.append('Tex. Bus. & Com. Code §541.104')
-    if 'VCDPA' in confirmed:
-        authorities.append('Va. Code Ann. §59.1-580')
+    if _VCDPA in confirmed:
+        authorities.append(_AUTH_VCDPA_PROCESSORS)
 
     if not authorities:
         return findings
 
     jurisdiction_label = ' / '.join(
-        j for j in ('GDPR', 'CCPA/CPRA', 'TDPSA', 'VCDPA') if j in confirmed
+        j for j in (_GDPR, _CCPA_CPRA, _TDPSA, _VCDPA) if j in confirmed
     )
 
     for vendor in matter.systems:
@@ -1574,8 +1664,8 @@ def analyse_breach_readiness_gaps(matter):
     """
     findings = []
     pb = matter.playbooks
-    gdpr_applies = 'GDPR' in matter.confirmed_jurisdictions.true_values()
-    J = 'GDPR' if gdpr_applies else 'General'
+    gdpr_applies = _GDPR in matter.confirmed_jurisdictions.true_values()
+    J = _GDPR if gdpr_applies else 'General'
     authority = (
         'Articles 33 and 34 GDPR' if gdpr_applies
         else 'General breach-response best practice'
@@ -1630,8 +1720,8 @@ def analyse_security_measures_gaps(matter):
     general best-practice framing.
     """
     findings = []
-    gdpr_applies = 'GDPR' in matter.confirmed_jurisdictions.true_values()
-    J = 'GDPR' if gdpr_applies else 'General'
+    gdpr_applies = _GDPR in matter.confirmed_jurisdictions.true_values()
+    J = _GDPR if gdpr_applies else 'General'
     authority = (
         'Article 32 GDPR' if gdpr_applies
         else 'General security best practice'
@@ -1675,16 +1765,16 @@ def analyse_staff_training_gaps(matter):
     confirmed = matter.confirmed_jurisdictions.true_values()
 
     authorities = []
-    if 'GDPR' in confirmed:
+    if _GDPR in confirmed:
         authorities.append('Article 5(2) GDPR (accountability); Article 39(1)(b)')
-    if 'CCPA/CPRA' in confirmed:
+    if _CCPA_CPRA in confirmed:
         authorities.append('Cal. Civ. Code §1798.135(a)(3)')
 
     if not authorities:
         return findings
 
     jurisdiction_label = ' / '.join(
-        j for j in ('GDPR', 'CCPA/CPRA') if j in confirmed
+        j for j in (_GDPR, _CCPA_CPRA) if j in confirmed
     )
 
     if not matter.playbooks.staff_trained:
@@ -1725,7 +1815,7 @@ def analyse_dpia_lia_gaps(matter):
     conclusion of "No" or "Undetermined."
     """
     findings = []
-    if 'GDPR' not in matter.confirmed_jurisdictions.true_values():
+    if _GDPR not in matter.confirmed_jurisdictions.true_values():
         return findings
 
     for activity in matter.processing_activities:
@@ -1736,7 +1826,7 @@ def analyse_dpia_lia_gaps(matter):
                     'further mitigation'
                 ):
                     findings.append(_gap(
-                        'GDPR',
+                        _GDPR,
                         'Unresolved DPIA Risk — {}'.format(activity.name),
                         'Article 35 GDPR',
                         'DPIA risk register for "{}" leaves a risk at '
@@ -1763,9 +1853,9 @@ def analyse_dpia_lia_gaps(matter):
             conclusion = activity.lia.conclusion
             if conclusion == 'No — an alternative lawful basis should be used':
                 findings.append(_gap(
-                    'GDPR',
+                    _GDPR,
                     'LIA Conclusion — {}'.format(activity.name),
-                    'Article 6(1)(f) GDPR',
+                    _AUTH_GDPR_LEGIT_INTERESTS,
                     'LIA for "{}" concluded the legitimate interests basis '
                     'is not supported.'.format(activity.name),
                     'The client\'s own Legitimate Interests Assessment for '
@@ -1783,9 +1873,9 @@ def analyse_dpia_lia_gaps(matter):
                 ))
             elif conclusion == 'Undetermined — needs further review':
                 findings.append(_gap(
-                    'GDPR',
+                    _GDPR,
                     'LIA Conclusion — {}'.format(activity.name),
-                    'Article 6(1)(f) GDPR',
+                    _AUTH_GDPR_LEGIT_INTERESTS,
                     'LIA for "{}" remains undetermined.'.format(activity.name),
                     'The client\'s Legitimate Interests Assessment for the '
                     '"{}" processing activity was left undetermined and '
@@ -1838,6 +1928,31 @@ def get_upcoming_obligations(matter):
 # -----------------------------------------------
 # Master gap analysis function (called from YAML)
 # -----------------------------------------------
+# (confirmed_jurisdictions key, analyser) in findings order. A None key
+# runs the analyser for every matter — those either apply across
+# jurisdictions or, like analyse_state_privacy_gaps, already iterate only
+# the confirmed subset themselves. The rule-table analysers are listed by
+# their generator form so their findings stream straight into the result
+# list without an intermediate list per jurisdiction.
+_ANALYSERS = (
+    (_GDPR, analyse_gdpr_gaps),
+    (_CCPA_CPRA, _iter_ccpa_gaps),
+    (_TDPSA, _iter_tdpsa_gaps),
+    (_VCDPA, _iter_vcdpa_gaps),
+    (None, analyse_state_privacy_gaps),
+    ('Maryland Online Data Privacy Act', analyse_md_gaps),
+    ('Minnesota Consumer Data Privacy Act', analyse_mn_gaps),
+    ('Connecticut Data Privacy Act', analyse_ct_gaps),
+    ('Iowa Consumer Data Protection Act', analyse_ia_gaps),
+    ('Utah Consumer Privacy Act', analyse_ut_gaps),
+    (None, analyse_vendor_dpa_gaps),
+    (None, analyse_breach_readiness_gaps),
+    (None, analyse_security_measures_gaps),
+    (None, analyse_staff_training_gaps),
+    (None, analyse_dpia_lia_gaps),
+)
+
+
 def run_gap_analysis(matter):
     """
     Runs all applicable gap analysis functions for the matter
@@ -1845,11 +1960,11 @@ def run_gap_analysis(matter):
 
     {
       'all': [list of all findings],
-      'by_jurisdiction': { 'GDPR': [...], 'CCPA/CPRA': [...], ... },
-      'by_severity': {
-          'Must Fix': [...],
-          'Should Fix': [...],
-          'Consider Fixing': [...]
+      'by_jurisdiction': { 'GDPR': (...), 'CCPA/CPRA': (...), ... },
+      'by_severity': {          # all three keys always present; each
+          'Must Fix': (...),      # bucket keeps the findings' order
+          'Should Fix': (...),    # from 'all'
+          'Consider Fixing': (...)
       },
       'counts': {
           'total': int,
@@ -1862,54 +1977,25 @@ def run_gap_analysis(matter):
       ]
     }
     """
-    confirmed = matter.confirmed_jurisdictions.true_values()
+    confirmed = frozenset(matter.confirmed_jurisdictions.true_values())
     all_findings = []
+    for jurisdiction, analyse in _ANALYSERS:
+        if jurisdiction is None or jurisdiction in confirmed:
+            all_findings.extend(analyse(matter))
 
-    if 'GDPR' in confirmed:
-        all_findings.extend(analyse_gdpr_gaps(matter))
-
-    if 'CCPA/CPRA' in confirmed:
-        all_findings.extend(analyse_ccpa_gaps(matter))
-
-    if 'TDPSA' in confirmed:
-        all_findings.extend(analyse_tdpsa_gaps(matter))
-
-    if 'VCDPA' in confirmed:
-        all_findings.extend(analyse_vcdpa_gaps(matter))
-
-    all_findings.extend(analyse_state_privacy_gaps(matter))
-
-    if 'Maryland Online Data Privacy Act' in confirmed:
-        all_findings.extend(analyse_md_gaps(matter))
-
-    if 'Minnesota Consumer Data Privacy Act' in confirmed:
-        all_findings.extend(analyse_mn_gaps(matter))
-
-    if 'Connecticut Data Privacy Act' in confirmed:
-        all_findings.extend(analyse_ct_gaps(matter))
-
-    if 'Iowa Consumer Data Protection Act' in confirmed:
-        all_findings.extend(analyse_ia_gaps(matter))
-
-    if 'Utah Consumer Privacy Act' in confirmed:
-        all_findings.extend(analyse_ut_gaps(matter))
-
-    all_findings.extend(analyse_vendor_dpa_gaps(matter))
-    all_findings.extend(analyse_breach_readiness_gaps(matter))
-    all_findings.extend(analyse_security_measures_gaps(matter))
-    all_findings.extend(analyse_staff_training_gaps(matter))
-    all_findings.extend(analyse_dpia_lia_gaps(matter))
-
+    # One pass over the findings fills both groupings; by_severity is
+    # keyed by the finding's own severity string, so every bucket is
+    # pre-created to keep all three keys present even when empty.
     by_jurisdiction = {}
+    by_severity = {MUST_FIX: [], SHOULD_FIX: [], CONSIDER: []}
     for f in all_findings:
-        j = f['jurisdiction']
-        by_jurisdiction.setdefault(j, []).append(f)
+        by_jurisdiction.setdefault(f['jurisdiction'], []).append(f)
+        by_severity[f['severity']].append(f)
 
-    by_severity = {
-        MUST_FIX: [f for f in all_findings if f['severity'] == MUST_FIX],
-        SHOULD_FIX: [f for f in all_findings if f['severity'] == SHOULD_FIX],
-        CONSIDER: [f for f in all_findings if f['severity'] == CONSIDER],
-    }
+    # The buckets are read-only once built and are stored (and pickled)
+    # with the session, so trim them to exact-size tuples.
+    by_jurisdiction = {j: tuple(fs) for j, fs in by_jurisdiction.items()}
+    by_severity = {sev: tuple(fs) for sev, fs in by_severity.items()}
 
     counts = {
         'total': len(all_findings),
@@ -38,6 +38,11 @@ Each detect_* function returns a dict:
   {'name': str, 'applies': bool, 'reason': str,
    'effective_date': 'YYYY-MM-DD', 'in_effect': bool}
 
+`operating_regions` / `consumer_regions` may be passed either as the
+interview's checkbox DADicts or as sets/frozensets of the ticked labels
+(detect_applicable_jurisdictions() hands every detector frozensets), so
+the detectors can also be exercised with plain built-in sets.
+
 `in_effect` is computed against the current date at call time, so a
 detector for an enacted-but-not-yet-effective law will correctly flip to
 True once its effective date passes without any code changes.
@@ -87,6 +92,18 @@ def _finalize(name, applies, reason):
     }
 
 
+def _selected(regions):
+    """
+    Returns the ticked labels of a region checkbox DADict as a frozenset.
+    Sets and frozensets of labels pass straight through, so
+    detect_applicable_jurisdictions() can read each DADict once and hand
+    the result to every detector.
+    """
+    if isinstance(regions, (set, frozenset)):
+        return regions
+    return frozenset(regions.true_values())
+
+
 # -----------------------------------------------
 # Threshold constants
 # -----------------------------------------------
@@ -101,6 +118,28 @@ VCDPA_REVENUE_SHARE_THRESHOLD = 25_000     # 25,000 consumers + 50% revenue
 
 TN_UT_REVENUE_FLOOR = 25_000_000           # TN/UT conjunctive $25M revenue gate
 
+# Threshold figures as they read in detector reasons, formatted once at
+# import rather than on every call.
+_CCPA_REVENUE_TEXT = f'${CCPA_REVENUE_THRESHOLD:,.0f}'
+_CCPA_CONSUMER_TEXT = f'{CCPA_CONSUMER_THRESHOLD:,}'
+_TDPSA_CONSUMER_TEXT = f'{TDPSA_CONSUMER_THRESHOLD:,}'
+_VCDPA_CONSUMER_TEXT = f'{VCDPA_CONSUMER_THRESHOLD:,}'
+_TN_UT_REVENUE_TEXT = f'${TN_UT_REVENUE_FLOOR:,.0f}'
+
+
+# -----------------------------------------------
+# Region labels (operating_regions / consumer_regions choices)
+# -----------------------------------------------
+_CA = 'California (US)'
+_TX = 'Texas (US)'
+_VA = 'Virginia (US)'
+_EU = 'European Union (EU)'
+_UK = 'United Kingdom (UK)'
+
+# A tuple rather than a set so GDPR reasons always list the EU before
+# the UK instead of in hash order.
+_EU_UK = (_EU, _UK)
+
 
 # -----------------------------------------------
 # Individual jurisdiction detectors
@@ -113,23 +152,22 @@ def detect_gdpr(operating_regions, consumer_regions):
     - Offers goods/services to EU/UK residents, OR
     - Monitors the behaviour of EU/UK residents
     """
-    eu_uk = {'European Union (EU)', 'United Kingdom (UK)'}
-
-    has_establishment = bool(eu_uk & set(operating_regions.true_values()))
-    targets_eu_uk = bool(eu_uk & set(consumer_regions.true_values()))
-
-    if has_establishment:
+    operating = _selected(operating_regions)
+    establishments = [region for region in _EU_UK if region in operating]
+    if establishments:
         reason = (
             'Client has an establishment in '
-            + ', '.join(eu_uk & set(operating_regions.true_values()))
+            + ', '.join(establishments)
             + '.'
         )
         return _finalize('GDPR', True, reason)
 
-    if targets_eu_uk:
+    consumers = _selected(consumer_regions)
+    targeted = [region for region in _EU_UK if region in consumers]
+    if targeted:
         reason = (
             'Client processes personal data of residents in '
-            + ', '.join(eu_uk & set(consumer_regions.true_values()))
+            + ', '.join(targeted)
             + '.'
         )
         return _finalize('GDPR', True, reason)
@@ -147,8 +185,8 @@ def detect_ccpa_cpra(operating_regions, consumer_regions,
     CCPA/CPRA applies to for-profit businesses doing business in California
     that meet at least one of three thresholds.
     """
-    operates_in_ca = 'California (US)' in operating_regions.true_values()
-    consumers_in_ca = 'California (US)' in consumer_regions.true_values()
+    operates_in_ca = _CA in _selected(operating_regions)
+    consumers_in_ca = _CA in _selected(consumer_regions)
 
     if not (operates_in_ca or consumers_in_ca):
         return _finalize(
@@ -161,13 +199,13 @@ def detect_ccpa_cpra(operating_regions, consumer_regions,
     if annual_revenue and annual_revenue >= CCPA_REVENUE_THRESHOLD:
         reasons.append(
             f'Annual revenue (${annual_revenue:,.0f}) meets or exceeds '
-            f'${CCPA_REVENUE_THRESHOLD:,.0f} threshold.'
+            f'{_CCPA_REVENUE_TEXT} threshold.'
         )
 
     if consumer_volume and consumer_volume >= CCPA_CONSUMER_THRESHOLD:
         reasons.append(
             f'Consumer volume ({consumer_volume:,}) meets or exceeds '
-            f'{CCPA_CONSUMER_THRESHOLD:,} threshold.'
+            f'{_CCPA_CONSUMER_TEXT} threshold.'
         )
 
     if sells_data:
@@ -191,8 +229,8 @@ def detect_tdpsa(operating_regions, consumer_regions,
     TDPSA applies to entities doing business in Texas or targeting Texas
     residents, processing 100,000+ consumers, excluding SBA small businesses.
     """
-    operates_in_tx = 'Texas (US)' in operating_regions.true_values()
-    consumers_in_tx = 'Texas (US)' in consumer_regions.true_values()
+    operates_in_tx = _TX in _selected(operating_regions)
+    consumers_in_tx = _TX in _selected(consumer_regions)
 
     if not (operates_in_tx or consumers_in_tx):
         return _finalize(
@@ -211,7 +249,7 @@ def detect_tdpsa(operating_regions, consumer_regions,
         return _finalize(
             'TDPSA', True,
             f'Client processes data of {consumer_volume:,} consumers '
-            f'(threshold: {TDPSA_CONSUMER_THRESHOLD:,}) and '
+            f'(threshold: {_TDPSA_CONSUMER_TEXT}) and '
             f'operates in or targets Texas.'
         )
 
@@ -229,8 +267,8 @@ def detect_vcdpa(operating_regions, consumer_regions,
     - 100,000+ Virginia consumers, OR
     - 25,000+ Virginia consumers AND derives 50%+ revenue from PI sale
     """
-    operates_in_va = 'Virginia (US)' in operating_regions.true_values()
-    consumers_in_va = 'Virginia (US)' in consumer_regions.true_values()
+    operates_in_va = _VA in _selected(operating_regions)
+    consumers_in_va = _VA in _selected(consumer_regions)
 
     if not (operates_in_va or consumers_in_va):
         return _finalize(
@@ -242,7 +280,7 @@ def detect_vcdpa(operating_regions, consumer_regions,
         return _finalize(
             'VCDPA', True,
             f'Client processes data of {consumer_volume:,} consumers '
-            f'(threshold: {VCDPA_CONSUMER_THRESHOLD:,}) and '
+            f'(threshold: {_VCDPA_CONSUMER_TEXT}) and '
             f'operates in or targets Virginia.'
         )
 
@@ -272,8 +310,8 @@ def _standard_two_prong_detector(name, state_label, statute_note,
     VCDPA detector does — the interview doesn't collect an exact revenue
     percentage, only a sells-data yes/no.
     """
-    operates = state_label in operating_regions.true_values()
-    has_consumers = state_label in consumer_regions.true_values()
+    operates = state_label in _selected(operating_regions)
+    has_consumers = state_label in _selected(consumer_regions)
 
     if not (operates or has_consumers):
         return _finalize(
@@ -333,8 +371,8 @@ def detect_ct(operating_regions, consumer_regions, consumer_volume,
     amount of sensitive data, OR offering personal data for sale — no
     revenue-percentage figure remains. Uses the amended (current) test.
     """
-    operates = 'Connecticut (US)' in operating_regions.true_values()
-    has_consumers = 'Connecticut (US)' in consumer_regions.true_values()
+    operates = 'Connecticut (US)' in _selected(operating_regions)
+    has_consumers = 'Connecticut (US)' in _selected(consumer_regions)
 
     if not (operates or has_consumers):
         return _finalize(
@@ -487,8 +525,8 @@ def detect_ne(operating_regions, consumer_regions, sells_data,
     processes or sells personal data and is NOT an SBA small business.
     Structurally different from every other detector in this module.
     """
-    operates = 'Nebraska (US)' in operating_regions.true_values()
-    has_consumers = 'Nebraska (US)' in consumer_regions.true_values()
+    operates = 'Nebraska (US)' in _selected(operating_regions)
+    has_consumers = 'Nebraska (US)' in _selected(consumer_regions)
 
     if not (operates or has_consumers):
         return _finalize(
@@ -585,8 +623,8 @@ def detect_tn(operating_regions, consumer_regions, annual_revenue,
     (25,000+ consumers AND >50% revenue from sale) OR 175,000+ consumers
     alone. Has a nonprofit and higher-ed exemption (§ 47-18-3210(a)).
     """
-    operates = 'Tennessee (US)' in operating_regions.true_values()
-    has_consumers = 'Tennessee (US)' in consumer_regions.true_values()
+    operates = 'Tennessee (US)' in _selected(operating_regions)
+    has_consumers = 'Tennessee (US)' in _selected(consumer_regions)
 
     if not (operates or has_consumers):
         return _finalize(
@@ -598,14 +636,14 @@ def detect_tn(operating_regions, consumer_regions, annual_revenue,
         return _finalize(
             'Tennessee Information Protection Act', False,
             f'Client operates in Tennessee but annual revenue does not '
-            f'appear to meet the ${TN_UT_REVENUE_FLOOR:,.0f} threshold '
+            f'appear to meet the {_TN_UT_REVENUE_TEXT} threshold '
             f'TIPA requires regardless of consumer volume. Verify manually.'
         )
 
     if consumer_volume and consumer_volume >= 175_000:
         return _finalize(
             'Tennessee Information Protection Act', True,
-            f'Client meets the ${TN_UT_REVENUE_FLOOR:,.0f}+ revenue floor '
+            f'Client meets the {_TN_UT_REVENUE_TEXT}+ revenue floor '
             f'and processes data of {consumer_volume:,} consumers '
             f'(threshold: 175,000).'
         )
@@ -613,7 +651,7 @@ def detect_tn(operating_regions, consumer_regions, annual_revenue,
     if consumer_volume and consumer_volume >= 25_000 and sells_data:
         return _finalize(
             'Tennessee Information Protection Act', True,
-            f'Client meets the ${TN_UT_REVENUE_FLOOR:,.0f}+ revenue floor, '
+            f'Client meets the {_TN_UT_REVENUE_TEXT}+ revenue floor, '
             f'processes data of {consumer_volume:,} consumers '
             f'(threshold: 25,000), and derives revenue from sale of '
             f'personal data.'
@@ -634,8 +672,8 @@ def detect_ut(operating_regions, consumer_regions, annual_revenue,
     on top of EITHER 100,000+ consumers OR (25,000+ consumers AND >50%
     revenue from sale).
     """
-    operates = 'Utah (US)' in operating_regions.true_values()
-    has_consumers = 'Utah (US)' in consumer_regions.true_values()
+    operates = 'Utah (US)' in _selected(operating_regions)
+    has_consumers = 'Utah (US)' in _selected(consumer_regions)
 
     if not (operates or has_consumers):
         return _finalize(
@@ -647,14 +685,14 @@ def detect_ut(operating_regions, consumer_regions, annual_revenue,
         return _finalize(
             'Utah Consumer Privacy Act', False,
             f'Client operates in Utah but annual revenue does not appear '
-            f'to meet the ${TN_UT_REVENUE_FLOOR:,.0f} threshold UCPA '
+            f'to meet the {_TN_UT_REVENUE_TEXT} threshold UCPA '
             f'requires regardless of consumer volume. Verify manually.'
         )
 
     if consumer_volume and consumer_volume >= 100_000:
         return _finalize(
             'Utah Consumer Privacy Act', True,
-            f'Client meets the ${TN_UT_REVENUE_FLOOR:,.0f}+ revenue floor '
+            f'Client meets the {_TN_UT_REVENUE_TEXT}+ revenue floor '
             f'and processes data of {consumer_volume:,} consumers '
             f'(threshold: 100,000).'
         )
@@ -662,7 +700,7 @@ def detect_ut(operating_regions, consumer_regions, annual_revenue,
     if consumer_volume and consumer_volume >= 25_000 and sells_data:
         return _finalize(
             'Utah Consumer Privacy Act', True,
-            f'Client meets the ${TN_UT_REVENUE_FLOOR:,.0f}+ revenue floor, '
+            f'Client meets the {_TN_UT_REVENUE_TEXT}+ revenue floor, '
             f'processes data of {consumer_volume:,} consumers '
             f'(threshold: 25,000), and derives revenue from sale of '
             f'personal data.'
@@ -697,6 +735,11 @@ def detect_applicable_jurisdictions(
     and (via `in_effect`) upcoming obligations for enacted-but-not-yet-
     effective laws.
     """
+    # Read each checkbox DADict once here rather than twice in every
+    # detector; the detectors take the resulting frozensets as-is.
+    operating_regions = _selected(operating_regions)
+    consumer_regions = _selected(consumer_regions)
+
     results = [
         detect_gdpr(operating_regions, consumer_regions),
         detect_ccpa_cpra(
@@ -748,30 +791,30 @@ def detect_applicable_jurisdictions(
 # DPIA / PIA risk flag (universal helper)
 # -----------------------------------------------
 
+# Built once at import rather than on every requires_dpia() call — the
+# helper runs per processing activity and again at the matter level.
+_HIGH_RISK_DATA = frozenset({
+    'Health or medical data',
+    'Biometric data',
+    'Precise geolocation data',
+    'Data relating to children (under 13 / under 16)',
+    'Racial or ethnic origin',
+    'Criminal conviction data',
+    'Genetic data',
+})
+_HIGH_RISK_PURPOSES = frozenset({
+    'Targeted or behavioural advertising',
+    'Profiling with significant effects',
+    'Sharing or selling to third parties',
+})
+
+
 def requires_dpia(data_types_collected, data_purposes):
     """
     Flags whether a DPIA/PIA is likely required based on
     high-risk data types or processing purposes.
     """
-    high_risk_data = [
-        'Health or medical data',
-        'Biometric data',
-        'Precise geolocation data',
-        'Data relating to children (under 13 / under 16)',
-        'Racial or ethnic origin',
-        'Criminal conviction data',
-        'Genetic data',
-    ]
-    high_risk_purposes = [
-        'Targeted or behavioural advertising',
-        'Profiling with significant effects',
-        'Sharing or selling to third parties',
-    ]
-
-    for item in high_risk_data:
-        if data_types_collected.get(item):
-            return True
-    for purpose in high_risk_purposes:
-        if data_purposes.get(purpose):
-            return True
-    return False
+    return (
+        any(data_types_collected.get(item) for item in _HIGH_RISK_DATA)
+        or any(data_purposes.get(purpose) for purpose in _HIGH_RISK_PURPOSES)
+    )
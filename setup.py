@@ -1,12 +1,15 @@
 import os
 import sys
+from pathlib import Path
 from setuptools import setup, find_packages
 
+long_description = Path(__file__).with_name('README.md').read_text(encoding='utf-8')
+
 setup(
     name='docassemble-privacy-doc-generator',
     version='0.1.1a',
     description='A Docassemble package for generating GDPR-compliant privacy policy documents',
-    long_description=open('README.md').read(),
+    long_description=long_description,
     long_description_content_type='text/markdown',
     url='https://github.com/MickLC/docassemble-privacy-doc-generator',
     author='MickLC',